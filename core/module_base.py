@@ -5,18 +5,22 @@ Provides common interface and functionality that all modules must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Awaitable
+from functools import partial
 from dataclasses import dataclass
 import logging
 
-@dataclass
+# Parent logger name shared by all security modules
+MODULE_LOGGER_PREFIX = "module."
+
+@dataclass(slots=True, frozen=True)
 class Tool:
     """Tool definition for MCP protocol"""
     name: str
     description: str
     inputSchema: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModuleConfig:
     """Module configuration container"""
     name: str
@@ -36,16 +40,29 @@ class SecurityModuleBase(ABC):
         self.config = config
         self.name = config.name
         self.enabled = config.enabled
-        self.logger = logging.getLogger(f"module.{self.name}")
+        self.logger = logging.getLogger(MODULE_LOGGER_PREFIX + self.name)
         self._tools = []
+        self._tools_by_name: Dict[str, Tool] = {}
+        self._handlers: Dict[str, Callable[..., Awaitable[str]]] = {}
+        self._deps_ok: Optional[bool] = None
         self._initialize()
+        
+        # Status fields that cannot change once tools are registered
+        self._static_status: Dict[str, Any] = {
+            "name": self.name,
+            "enabled": None,
+            "available": None,
+            "tools_count": len(self._tools),
+            "tools": [tool.name for tool in self._tools],
+            "dependencies_met": None
+        }
     
     def _initialize(self):
         """Initialize the module. Override for custom initialization."""
         self.logger.info(f"Initializing {self.name} module")
         
         # Validate dependencies
-        if not self._check_dependencies():
+        if not self._deps_ok_cached():
             self.enabled = False
             self.logger.warning(f"Module {self.name} disabled due to missing dependencies")
             return
@@ -53,6 +70,16 @@ class SecurityModuleBase(ABC):
         # Load tools
         try:
             self._tools = self._register_tools()
+            for tool in self._tools:
+                if tool.name in self._tools_by_name:
+                    self.logger.warning(f"Duplicate tool name '{tool.name}' in module {self.name}")
+                    continue
+                self._tools_by_name[tool.name] = tool
+            handlers = self._get_tool_handlers()
+            self._handlers = {
+                name: handler for name, handler in handlers.items()
+                if name in self._tools_by_name
+            }
             self.logger.info(f"Registered {len(self._tools)} tools for {self.name}")
         except Exception as e:
             self.logger.error(f"Failed to register tools for {self.name}: {str(e)}")
@@ -68,6 +95,18 @@ class SecurityModuleBase(ABC):
         """
         pass
     
+    def _get_tool_handlers(self) -> Dict[str, Callable[..., Awaitable[str]]]:
+        """
+        Map tool names to the coroutine functions that execute them.
+        
+        The default routes every registered tool through execute_tool().
+        Override to dispatch straight to bound handler methods.
+        
+        Returns:
+            Dict[str, Callable[..., Awaitable[str]]]: Tool name to handler
+        """
+        return {name: partial(self.execute_tool, name) for name in self._tools_by_name}
+    
     @abstractmethod
     async def execute_tool(self, tool_name: str, **kwargs) -> str:
         """
@@ -92,26 +131,35 @@ class SecurityModuleBase(ABC):
         """
         pass
     
+    def _deps_ok_cached(self) -> bool:
+        """Return the memoized result of _check_dependencies()."""
+        if self._deps_ok is None:
+            self._deps_ok = bool(self._check_dependencies())
+        return self._deps_ok
+    
+    def invalidate_dependency_cache(self):
+        """Forget the memoized dependency check so the next call re-probes."""
+        self._deps_ok = None
+    
     def get_tools(self) -> List[Tool]:
-        """Get list of tools provided by this module."""
-        if not self.enabled:
-            return []
+        """
+        Get list of tools provided by this module.
+        
+        Callers filter on ``enabled`` (see ModuleRegistry.get_enabled_modules).
+        """
         return self._tools
     
     def is_available(self) -> bool:
         """Check if module is available and enabled."""
-        return self.enabled and self._check_dependencies()
+        return self.enabled and self._deps_ok_cached()
     
     def get_tool(self, tool_name: str) -> Optional[Tool]:
         """Get specific tool by name."""
-        for tool in self._tools:
-            if tool.name == tool_name:
-                return tool
-        return None
+        return self._tools_by_name.get(tool_name)
     
     def has_tool(self, tool_name: str) -> bool:
         """Check if module provides a specific tool."""
-        return self.get_tool(tool_name) is not None
+        return tool_name in self._tools_by_name
     
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Get configuration value with fallback to default."""
@@ -119,31 +167,30 @@ class SecurityModuleBase(ABC):
     
     def get_status(self) -> Dict[str, Any]:
         """Get module status information."""
-        return {
-            "name": self.name,
-            "enabled": self.enabled,
-            "available": self.is_available(),
-            "tools_count": len(self._tools),
-            "tools": [tool.name for tool in self._tools],
-            "dependencies_met": self._check_dependencies()
-        }
+        status = dict(self._static_status)
+        status["enabled"] = self.enabled
+        status["available"] = self.is_available()
+        status["dependencies_met"] = self._deps_ok_cached()
+        return status
     
     async def safe_execute_tool(self, tool_name: str, **kwargs) -> str:
         """
         Safely execute a tool with error handling and validation.
+        
+        Callers are expected to resolve the module through ModuleRegistry,
+        which only returns enabled modules.
         """
         try:
-            if not self.is_available():
-                return f"❌ Module '{self.name}' is not available"
-            
-            if not self.has_tool(tool_name):
+            handler = self._handlers.get(tool_name)
+            if handler is None:
                 return f"❌ Tool '{tool_name}' not found in module '{self.name}'"
             
-            self.logger.info(f"Executing tool '{tool_name}' with params: {list(kwargs.keys())}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Executing tool '%s' with params: %s", tool_name, list(kwargs))
             
-            result = await self.execute_tool(tool_name, **kwargs)
+            result = await handler(**kwargs)
             
-            self.logger.info(f"Tool '{tool_name}' executed successfully")
+            self.logger.info("Tool '%s' executed successfully", tool_name)
             return result
             
         except Exception as e:
@@ -157,13 +204,41 @@ class ModuleRegistry:
     
     def __init__(self):
         self.modules: Dict[str, SecurityModuleBase] = {}
+        self._tool_index: Dict[str, SecurityModuleBase] = {}
+        self._all_tools_cache: Optional[List[Tool]] = None
+        self._tools_dict_cache: Optional[List[Dict[str, Any]]] = None
         self.logger = logging.getLogger("module_registry")
     
     def register_module(self, module: SecurityModuleBase):
         """Register a module in the registry."""
+        replacing = module.name in self.modules
         self.modules[module.name] = module
+        
+        if replacing:
+            # Drop the previous instance's tools; rebuilding in registry order
+            # lets other providers of the same names take over as before.
+            self._tool_index = {}
+            for registered in self.modules.values():
+                self._index_tools(registered)
+        else:
+            self._index_tools(module)
+        
+        self._all_tools_cache = None
+        self._tools_dict_cache = None
         self.logger.info(f"Registered module: {module.name}")
     
+    def _index_tools(self, module: SecurityModuleBase):
+        """Add a module's tools to the name index; the first provider wins."""
+        # Disabled modules are never indexed, so they cannot shadow an enabled provider
+        if not module.enabled:
+            return
+        for tool in module.get_tools():
+            owner = self._tool_index.setdefault(tool.name, module)
+            if owner is not module:
+                self.logger.warning(
+                    f"Tool '{tool.name}' from {module.name} already provided by {owner.name}"
+                )
+    
     def get_module(self, name: str) -> Optional[SecurityModuleBase]:
         """Get module by name."""
         return self.modules.get(name)
@@ -178,17 +253,32 @@ class ModuleRegistry:
     
     def get_all_tools(self) -> List[Tool]:
         """Get all tools from all enabled modules."""
-        tools = []
-        for module in self.get_enabled_modules():
-            tools.extend(module.get_tools())
-        return tools
+        if self._all_tools_cache is None:
+            tools = []
+            for module in self.get_enabled_modules():
+                tools.extend(module.get_tools())
+            self._all_tools_cache = tools
+        return self._all_tools_cache
+    
+    def get_all_tools_dict(self) -> List[Dict[str, Any]]:
+        """Get all tools as JSON-serializable dictionaries (cached)."""
+        if self._tools_dict_cache is None:
+            self._tools_dict_cache = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema
+                }
+                for tool in self.get_all_tools()
+            ]
+        return self._tools_dict_cache
     
     def find_tool(self, tool_name: str) -> Optional[SecurityModuleBase]:
         """Find which module provides a specific tool."""
-        for module in self.get_enabled_modules():
-            if module.has_tool(tool_name):
-                return module
-        return None
+        module = self._tool_index.get(tool_name)
+        if module is None or not module.enabled:
+            return None
+        return module
     
     async def execute_tool(self, tool_name: str, **kwargs) -> str:
         """Execute a tool by finding the appropriate module."""
@@ -9,12 +9,15 @@ import sys
 import importlib
 import importlib.util
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Type
+from typing import Dict, List, Any, Optional, Tuple, Type
 import logging
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 
 from .module_base import SecurityModuleBase, ModuleConfig, ModuleRegistry
 
+# File name suffix that marks a loadable security module
+MODULE_FILE_SUFFIX = "_module.py"
+
 class ModuleLoader:
     """
     Loads and manages security modules dynamically.
@@ -22,22 +25,34 @@ class ModuleLoader:
     Discovers modules in the modules directory and loads them based on configuration.
     """
     
+    # Upper bound on threads used to import module files in parallel
+    MAX_LOAD_WORKERS = 8
+    
     def __init__(self, modules_dir: str = "modules", config_path: str = "config/modules_config.yaml"):
         self.modules_dir = Path(modules_dir)
         self.config_path = Path(config_path)
         self.logger = logging.getLogger("module_loader")
         self.registry = ModuleRegistry()
         self._module_configs = {}
+        self._class_cache: Dict[str, Type[SecurityModuleBase]] = {}
+        self._discovered_cache: Optional[List[str]] = None
+        self._discovered_mtime: Optional[float] = None
         
         # Load module configurations
         self._load_module_configs()
     
     def _load_module_configs(self):
         """Load module configurations from YAML file."""
+        # Imported here to keep it off the --help path; a missing PyYAML is fatal
+        import yaml
+        
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as f:
-                    self._module_configs = yaml.safe_load(f) or {}
+                    self._module_configs = yaml.load(f, Loader=loader) or {}
                 self.logger.info(f"Loaded module configs from {self.config_path}")
             else:
                 self.logger.warning(f"Module config file not found: {self.config_path}")
@@ -47,25 +62,57 @@ class ModuleLoader:
             self._module_configs = {}
     
     def discover_modules(self) -> List[str]:
-        """Discover available modules in the modules directory."""
-        modules = []
+        """
+        Discover available modules in the modules directory.
         
-        if not self.modules_dir.exists():
+        The result is cached and only rescanned when the directory's mtime changes.
+        """
+        try:
+            mtime = os.stat(self.modules_dir).st_mtime
+        except OSError:
             self.logger.warning(f"Modules directory not found: {self.modules_dir}")
-            return modules
+            self.refresh_discovery()
+            return []
+        
+        if self._discovered_cache is not None and mtime == self._discovered_mtime:
+            return list(self._discovered_cache)
+        
+        modules = []
+        
+        with os.scandir(self.modules_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.endswith(MODULE_FILE_SUFFIX) and not name.startswith("__")
+                        and entry.is_file()):
+                    module_name = name[:-len(MODULE_FILE_SUFFIX)]
+                    modules.append(module_name)
+                    self.logger.debug(f"Discovered module: {module_name}")
         
-        for file_path in self.modules_dir.glob("*_module.py"):
-            if file_path.is_file() and not file_path.name.startswith("__"):
-                module_name = file_path.stem.replace("_module", "")
-                modules.append(module_name)
-                self.logger.debug(f"Discovered module: {module_name}")
+        # scandir order is filesystem-dependent; keep discovery deterministic
+        modules.sort()
         
         self.logger.info(f"Discovered {len(modules)} modules: {modules}")
-        return modules
+        self._discovered_cache = modules
+        self._discovered_mtime = mtime
+        return list(modules)
+    
+    def refresh_discovery(self):
+        """Drop the cached discovery result so the next call rescans the directory."""
+        self._discovered_cache = None
+        self._discovered_mtime = None
+    
+    def _get_config_entry(self, module_name: str) -> Dict[str, Any]:
+        """Get a module's raw config entry, treating empty or malformed entries as {}."""
+        entry = self._module_configs.get(module_name) if isinstance(self._module_configs, dict) else None
+        return entry if isinstance(entry, dict) else {}
+    
+    def _is_enabled_in_config(self, module_name: str) -> bool:
+        """Check the parsed configuration for a module's enabled flag."""
+        return self._get_config_entry(module_name).get("enabled", True)
     
     def _get_module_config(self, module_name: str) -> ModuleConfig:
         """Get configuration for a specific module."""
-        config_data = self._module_configs.get(module_name, {})
+        config_data = self._get_config_entry(module_name)
         
         return ModuleConfig(
             name=module_name,
@@ -76,70 +123,105 @@ class ModuleLoader:
     
     def _load_module_class(self, module_name: str) -> Optional[Type[SecurityModuleBase]]:
         """Load a module class from file."""
+        cached_class = self._class_cache.get(module_name)
+        if cached_class is not None:
+            return cached_class
+        
+        full_mod_name = f"modules.{module_name}_module"
+        
         try:
             module_file = self.modules_dir / f"{module_name}_module.py"
+            module = sys.modules.get(full_mod_name)
             
-            if not module_file.exists():
-                self.logger.error(f"Module file not found: {module_file}")
-                return None
-            
-            # Load module spec
-            spec = importlib.util.spec_from_file_location(
-                f"modules.{module_name}_module", 
-                module_file
-            )
-            
-            if spec is None or spec.loader is None:
-                self.logger.error(f"Failed to create spec for module: {module_name}")
-                return None
-            
-            # Import module
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Find the module class
-            class_name = f"{module_name.title()}Module"
+            if module is None:
+                if not module_file.exists():
+                    self.logger.error("Module file not found: %s", module_file)
+                    return None
+                
+                # Load module spec
+                spec = importlib.util.spec_from_file_location(full_mod_name, module_file)
+                
+                if spec is None or spec.loader is None:
+                    self.logger.error("Failed to create spec for module: %s", module_name)
+                    return None
+                
+                # Import module and publish it so later loads reuse it
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[full_mod_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    sys.modules.pop(full_mod_name, None)
+                    raise
             
-            if not hasattr(module, class_name):
-                self.logger.error(f"Module class '{class_name}' not found in {module_file}")
-                return None
+            # Find the module class: explicit MODULE_CLASS first, naming convention second
+            module_class = getattr(module, "MODULE_CLASS", None)
             
-            module_class = getattr(module, class_name)
+            if module_class is not None:
+                class_name = getattr(module_class, "__name__", repr(module_class))
+            else:
+                class_name = f"{module_name.title()}Module"
+                module_class = getattr(module, class_name, None)
+                
+                if module_class is None:
+                    self.logger.error("Module class '%s' not found in %s", class_name, module_file)
+                    return None
             
             # Verify it's a subclass of SecurityModuleBase
-            if not issubclass(module_class, SecurityModuleBase):
-                self.logger.error(f"Module class '{class_name}' is not a subclass of SecurityModuleBase")
+            if not (isinstance(module_class, type) and issubclass(module_class, SecurityModuleBase)):
+                self.logger.error("Module class '%s' is not a subclass of SecurityModuleBase", class_name)
                 return None
             
-            self.logger.debug(f"Successfully loaded module class: {class_name}")
+            self._class_cache[module_name] = module_class
+            self.logger.debug("Successfully loaded module class: %s", class_name)
             return module_class
             
         except Exception as e:
-            self.logger.error(f"Failed to load module '{module_name}': {str(e)}")
+            self.logger.error("Failed to load module '%s': %s", module_name, e)
             return None
     
-    def load_module(self, module_name: str) -> Optional[SecurityModuleBase]:
-        """Load a specific module."""
+    def _create_module(self, module_name: str) -> Tuple[Optional[SecurityModuleBase], Optional[str]]:
+        """
+        Import and instantiate a module without registering it.
+        
+        Returns:
+            Tuple[Optional[SecurityModuleBase], Optional[str]]: (instance, error_message)
+        """
         try:
             config = self._get_module_config(module_name)
             
             if not config.enabled:
                 self.logger.info(f"Module '{module_name}' is disabled in configuration")
-                return None
+                return None, None
             
             module_class = self._load_module_class(module_name)
             if module_class is None:
-                return None
-            
-            module_instance = module_class(config)
-            self.registry.register_module(module_instance)
+                return None, None
             
-            self.logger.info(f"Successfully loaded module: {module_name}")
-            return module_instance
+            return module_class(config), None
             
         except Exception as e:
-            self.logger.error(f"Failed to load module '{module_name}': {str(e)}")
+            return None, str(e)
+    
+    def load_module(self, module_name: str) -> Optional[SecurityModuleBase]:
+        """Load a specific module."""
+        module_instance, error = self._create_module(module_name)
+        return self._register_loaded(module_name, module_instance, error)
+    
+    def _register_loaded(self, module_name: str,
+                         module_instance: Optional[SecurityModuleBase],
+                         error: Optional[str]) -> Optional[SecurityModuleBase]:
+        """Register a freshly created module instance, logging the outcome."""
+        if error is not None:
+            self.logger.error(f"Failed to load module '{module_name}': {error}")
             return None
+        
+        if module_instance is None:
+            return None
+        
+        self.registry.register_module(module_instance)
+        self.logger.info(f"Successfully loaded module: {module_name}")
+        return module_instance
     
     def load_all_modules(self, enabled_modules: Optional[List[str]] = None) -> int:
         """Load all discovered modules or a specific subset."""
@@ -150,11 +232,26 @@ class ModuleLoader:
         else:
             modules_to_load = discovered_modules
         
+        # Skip modules disabled in configuration before importing anything
+        disabled = [m for m in modules_to_load if not self._is_enabled_in_config(m)]
+        if disabled:
+            self.logger.info(f"Skipping modules disabled in configuration: {disabled}")
+            modules_to_load = [m for m in modules_to_load if m not in disabled]
+        
         loaded_count = 0
         
-        for module_name in modules_to_load:
-            if self.load_module(module_name) is not None:
-                loaded_count += 1
+        if modules_to_load:
+            # Only the module file imports run in worker threads (filling the
+            # class cache). Instances are built on the calling thread, so
+            # constructors still see the caller's event loop, and are
+            # registered in discovery order.
+            max_workers = min(self.MAX_LOAD_WORKERS, len(modules_to_load))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._load_module_class, modules_to_load))
+            
+            for module_name in modules_to_load:
+                if self.load_module(module_name) is not None:
+                    loaded_count += 1
         
         self.logger.info(f"Loaded {loaded_count}/{len(modules_to_load)} modules")
         return loaded_count
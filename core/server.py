@@ -8,12 +8,37 @@ import asyncio
 import json
 import sys
 import logging
+import os
+import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
 
 from .module_loader import ModuleLoader
 from .module_base import ModuleRegistry
 
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a JSON-RPC message to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data):
+    """Parse a JSON-RPC message from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Largest single JSON-RPC line accepted on stdin
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
 class SecurityMCPServer:
     """
     Main MCP Server that handles the Model Context Protocol.
@@ -25,7 +50,8 @@ class SecurityMCPServer:
                  name: str = "security-mcp-server", 
                  version: str = "2.0.0",
                  modules_dir: str = "modules",
-                 config_path: str = "config"):
+                 config_path: str = "config",
+                 max_concurrent_requests: int = 5):
         
         self.name = name
         self.version = version
@@ -40,10 +66,19 @@ class SecurityMCPServer:
         self.registry: ModuleRegistry = self.module_loader.get_registry()
         
         # Server statistics
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         self.request_count = 0
         self.error_count = 0
         
+        # Outbound stdio batching
+        self._write = None
+        self._write_buffer = bytearray()
+        self._flush_scheduled = False
+        self._stdio_blocking: Dict[int, bool] = {}
+        
+        # Upper bound on stdio requests handled at once
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        
         self.logger.info(f"Security MCP Server initialized: {name} v{version}")
     
     async def initialize_modules(self, enabled_modules: Optional[List[str]] = None) -> int:
@@ -71,7 +106,8 @@ class SecurityMCPServer:
         params = message.get("params", {})
         msg_id = message.get("id")
         
-        self.logger.debug(f"Handling request: {method} (ID: {msg_id})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Handling request: %s (ID: %s)", method, msg_id)
         
         try:
             if method == "initialize":
@@ -87,7 +123,7 @@ class SecurityMCPServer:
                 
         except Exception as e:
             self.error_count += 1
-            self.logger.error(f"Error handling message: {str(e)}")
+            self.logger.error("Error handling message: %s", e)
             return self._error_response(msg_id, -32603, f"Internal error: {str(e)}")
     
     async def _handle_initialize(self, msg_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -114,18 +150,10 @@ class SecurityMCPServer:
     
     async def _handle_tools_list(self, msg_id: int) -> Dict[str, Any]:
         """Handle tools listing request."""
-        tools = self.registry.get_all_tools()
+        # Serializable tool list is built once and cached by the registry
+        tools_dict = self.registry.get_all_tools_dict()
         
-        # Convert Tool objects to dictionaries for JSON serialization
-        tools_dict = []
-        for tool in tools:
-            tools_dict.append({
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema
-            })
-        
-        self.logger.debug(f"Returning {len(tools_dict)} tools")
+        self.logger.debug("Returning %d tools", len(tools_dict))
         
         return {
             "jsonrpc": "2.0",
@@ -143,7 +171,7 @@ class SecurityMCPServer:
         if not tool_name:
             return self._error_response(msg_id, -32602, "Missing tool name")
         
-        self.logger.info(f"Executing tool: {tool_name}")
+        self.logger.info("Executing tool: %s", tool_name)
         
         # Execute tool through registry
         result = await self.registry.execute_tool(tool_name, **arguments)
@@ -163,12 +191,11 @@ class SecurityMCPServer:
     
     async def _handle_server_status(self, msg_id: int) -> Dict[str, Any]:
         """Handle server status request."""
-        uptime = datetime.now() - self.start_time
         status = {
             "server": {
                 "name": self.name,
                 "version": self.version,
-                "uptime_seconds": int(uptime.total_seconds()),
+                "uptime_seconds": int(time.monotonic() - self.start_time),
                 "requests_handled": self.request_count,
                 "errors": self.error_count
             },
@@ -192,38 +219,185 @@ class SecurityMCPServer:
             }
         }
     
-    async def run_stdio(self):
-        """Main event loop for stdio transport."""
-        self.logger.info("🛡️  Security MCP Server started (stdio mode)")
+    async def _open_stdio(self):
+        """
+        Attach asyncio streams to stdin/stdout.
+        
+        Falls back to blocking I/O in the default executor when stdio is a
+        regular file, which pipe transports do not support, or a terminal,
+        whose file description is shared with stderr and the parent shell.
+        Pipe transports switch their fd to non-blocking; the original modes
+        are recorded here and put back by _restore_stdio().
+        """
+        loop = asyncio.get_running_loop()
+        sys.stdout.flush()
+        
+        try:
+            if sys.stdin.isatty():
+                raise ValueError("stdin is a terminal")
+            self._stdio_blocking[sys.stdin.fileno()] = os.get_blocking(sys.stdin.fileno())
+            reader = asyncio.StreamReader(limit=MAX_MESSAGE_BYTES)
+            protocol = asyncio.StreamReaderProtocol(reader)
+            await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+            
+            async def readline():
+                return await self._read_message(reader)
+        except (ValueError, OSError):
+            def readline():
+                return loop.run_in_executor(None, sys.stdin.buffer.readline)
+        
+        try:
+            if sys.stdout.isatty():
+                raise ValueError("stdout is a terminal")
+            self._stdio_blocking[sys.stdout.fileno()] = os.get_blocking(sys.stdout.fileno())
+            transport, flow = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+            writer = asyncio.StreamWriter(transport, flow, None, loop)
+            write = writer.write
+            drain = writer.drain
+        except (ValueError, OSError):
+            def write(data: bytes):
+                sys.stdout.buffer.write(data)
+                sys.stdout.buffer.flush()
+            
+            async def drain():
+                pass
+        
+        return readline, write, drain
+    
+    def _restore_stdio(self):
+        """Put stdin/stdout back into the blocking modes they had before run_stdio."""
+        for fd, blocking in self._stdio_blocking.items():
+            try:
+                os.set_blocking(fd, blocking)
+            except OSError:
+                pass
+        self._stdio_blocking.clear()
+    
+    async def _read_message(self, reader: asyncio.StreamReader) -> bytes:
+        """
+        Read one newline-terminated message.
+        
+        A line longer than the reader limit is consumed up to and including
+        its newline, then reported with ValueError.
+        """
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
         
+        # Drop the oversized line without losing the messages after it
         while True:
+            await reader.readexactly(consumed)
             try:
-                line = sys.stdin.readline()
-                if not line:
-                    break
+                await reader.readuntil(b"\n")
+                break
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+        
+        raise ValueError(f"Message exceeds {MAX_MESSAGE_BYTES} bytes")
+    
+    def _queue_response(self, response: Dict[str, Any]):
+        """Buffer a response; the buffer is flushed once per event-loop tick."""
+        self._write_buffer += _dumps(response) + b"\n"
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_responses)
+    
+    def _flush_responses(self):
+        """Write all buffered responses with a single call."""
+        self._flush_scheduled = False
+        if self._write_buffer:
+            self._write(bytes(self._write_buffer))
+            self._write_buffer.clear()
+    
+    async def _process_line(self, line: bytes):
+        """Parse, handle and queue the response for a single JSON-RPC line."""
+        try:
+            try:
+                message = _loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                self._queue_response(
+                    self._error_response(None, -32700, f"Parse error: {str(e)}")
+                )
+                return
+            
+            if not isinstance(message, dict):
+                self._queue_response(
+                    self._error_response(None, -32600, "Invalid Request: expected a JSON object")
+                )
+                return
+            
+            response = await self.handle_message(message)
+            if response:
+                self._queue_response(response)
                 
-                line = line.strip()
-                if not line:
-                    continue
+        except Exception as e:
+            self.error_count += 1
+            self.logger.error("Unexpected error processing message: %s", e)
+            self._queue_response(
+                self._error_response(None, -32603, f"Internal error: {str(e)}")
+            )
+    
+    async def run_stdio(self):
+        """
+        Main event loop for stdio transport.
+        
+        Each request is handled in its own task so pipelined requests run
+        concurrently, up to max_concurrent_requests at a time; responses are
+        written as they complete.
+        """
+        readline, self._write, drain = await self._open_stdio()
+        try:
+            pending = set()
+            slots = asyncio.Semaphore(self.max_concurrent_requests)
+            
+            self.logger.info("🛡️  Security MCP Server started (stdio mode)")
+            
+            while True:
+                try:
+                    line = await readline()
+                    if not line:
+                        break
+                    
+                    line = line.strip()
+                    if not line:
+                        continue
+                    
+                    # Stop reading while the in-flight limit is reached
+                    await slots.acquire()
+                    task = asyncio.create_task(self._process_line(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                    task.add_done_callback(lambda _: slots.release())
+                    
+                    await drain()
                 
-                message = json.loads(line)
-                response = await self.handle_message(message)
+                except ValueError as e:
+                    # Line exceeded the reader limit and has been skipped
+                    self.logger.error("Rejected oversized message: %s", e)
+                    self._queue_response(
+                        self._error_response(None, -32700, f"Parse error: {str(e)}")
+                    )
                 
-                if response:
-                    print(json.dumps(response), flush=True)
-                    
-            except json.JSONDecodeError as e:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": f"Parse error: {str(e)}"
-                    }
-                }
-                print(json.dumps(error_response), flush=True)
-            except Exception as e:
-                self.logger.error(f"Unexpected error: {str(e)}")
-                break
+                except Exception as e:
+                    self.logger.error(f"Unexpected error: {str(e)}")
+                    break
+            
+            if pending:
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.logger.error(f"Unexpected error: {str(result)}")
+            
+            self._flush_responses()
+            await drain()
+        finally:
+            self._restore_stdio()
         
         self.logger.info("MCP Server shutdown")
\ No newline at end of file
@@ -15,13 +15,16 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.server import SecurityMCPServer
 from utils.logger import setup_logging
 
+if TYPE_CHECKING:
+    from core.server import SecurityMCPServer
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -61,9 +64,16 @@ def parse_arguments():
         help='Modules directory path'
     )
     
+    parser.add_argument(
+        '--max-concurrent', 
+        type=int, 
+        default=5, 
+        help='Maximum number of MCP requests handled concurrently'
+    )
+    
     return parser.parse_args()
 
-async def show_status(server: SecurityMCPServer):
+async def show_status(server: "SecurityMCPServer"):
     """Show server and modules status."""
     print("🛡️  Security MCP Server Status")
     print("=" * 40)
@@ -102,10 +112,14 @@ async def main():
     log_level = logging.DEBUG if args.debug else logging.INFO
     setup_logging(level=log_level)
     
+    # Imported after argument parsing so --help skips the server import graph
+    from core.server import SecurityMCPServer
+    
     # Create server
     server = SecurityMCPServer(
         modules_dir=args.modules_dir,
-        config_path=args.config_dir
+        config_path=args.config_dir,
+        max_concurrent_requests=args.max_concurrent
     )
     
     # Handle status command
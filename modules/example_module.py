@@ -5,11 +5,82 @@ Copy this file to create new modules.
 """
 
 import asyncio
-from typing import List
+import shutil
+import sys
+from typing import Awaitable, Callable, Dict, List, Tuple
 
 from core.module_base import SecurityModuleBase, Tool, ModuleConfig
 from utils.validators import validate_target
 
+# The ping binary cannot appear or disappear from PATH mid-process
+_PING_AVAILABLE = shutil.which('ping') is not None
+
+_PIPE = asyncio.subprocess.PIPE
+
+# Whether ping's -W takes seconds (Linux iputils)
+_PING_WAIT_SECONDS = sys.platform.startswith('linux')
+
+# Cap on captured ping output per stream; anything beyond is drained and dropped
+MAX_OUTPUT_BYTES = 64 * 1024
+
+# In-flight ping runs keyed by (target, count, verbose), shared by concurrent callers
+_inflight_pings: Dict[Tuple[str, int, bool], "asyncio.Future[str]"] = {}
+
+async def _read_bounded(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a stream to EOF, keeping at most `limit` bytes."""
+    data = bytearray()
+    while True:
+        chunk = await stream.read(8192)
+        if not chunk:
+            return bytes(data)
+        if len(data) < limit:
+            data += chunk[:limit - len(data)]
+
+# Tool input schemas, shared by every ExampleModule instance. Kept as plain
+# dicts (not MappingProxyType) so they serialize directly in tools/list.
+_PING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "target": {
+            "type": "string",
+            "description": "Target to ping (IP or domain)"
+        },
+        "count": {
+            "type": "integer",
+            "description": "Number of ping packets",
+            "minimum": 1,
+            "maximum": 10,
+            "default": 4
+        },
+        "verbose": {
+            "type": "boolean",
+            "description": "Return per-packet output instead of the summary only",
+            "default": False
+        }
+    },
+    "required": ["target"]
+}
+
+_INFO_SCHEMA = {
+    "type": "object",
+    "properties": {}
+}
+
+_INFO_TEMPLATE = """📄 Example Module Information
+
+Module: {name}
+Status: {status}
+Tools: {tools}
+Config: {config}
+
+This is an example module that demonstrates:
+- Tool registration and execution
+- Input validation
+- Async tool execution
+- Error handling
+
+Use this as a template for creating new security modules."""
+
 class ExampleModule(SecurityModuleBase):
     """
     Example module showing how to implement security tools.
@@ -23,31 +94,12 @@ class ExampleModule(SecurityModuleBase):
             Tool(
                 name="example_ping",
                 description="Example ping tool for testing connectivity",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "target": {
-                            "type": "string",
-                            "description": "Target to ping (IP or domain)"
-                        },
-                        "count": {
-                            "type": "integer",
-                            "description": "Number of ping packets",
-                            "minimum": 1,
-                            "maximum": 10,
-                            "default": 4
-                        }
-                    },
-                    "required": ["target"]
-                }
+                inputSchema=_PING_SCHEMA
             ),
             Tool(
                 name="example_info",
                 description="Get example module information",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
+                inputSchema=_INFO_SCHEMA
             )
         ]
     
@@ -57,31 +109,33 @@ class ExampleModule(SecurityModuleBase):
         
         For this example, we just check if ping command exists.
         """
-        try:
-            import subprocess
-            result = subprocess.run(['ping', '-c', '1', '127.0.0.1'], 
-                                  capture_output=True, timeout=5)
-            return True
-        except Exception:
-            return False
+        return _PING_AVAILABLE
+    
+    # Tool name -> handler method name
+    _TOOL_METHODS = {
+        "example_ping": "_ping_tool",
+        "example_info": "_info_tool"
+    }
+    
+    def _get_tool_handlers(self) -> Dict[str, Callable[..., Awaitable[str]]]:
+        """Map tool names to their bound handler methods."""
+        return {name: getattr(self, method) for name, method in self._TOOL_METHODS.items()}
     
     async def execute_tool(self, tool_name: str, **kwargs) -> str:
         """Execute the specified tool."""
-        
-        if tool_name == "example_ping":
-            return await self._ping_tool(**kwargs)
-        elif tool_name == "example_info":
-            return await self._info_tool()
-        else:
+        method = self._TOOL_METHODS.get(tool_name)
+        if method is None:
             return f"❌ Unknown tool: {tool_name}"
+        return await getattr(self, method)(**kwargs)
     
-    async def _ping_tool(self, target: str, count: int = 4) -> str:
+    async def _ping_tool(self, target: str, count: int = 4, verbose: bool = False) -> str:
         """
         Example ping implementation.
         
         Args:
             target: Target to ping
             count: Number of ping packets
+            verbose: Include per-packet lines, not just the summary
             
         Returns:
             str: Ping results
@@ -92,50 +146,92 @@ class ExampleModule(SecurityModuleBase):
             return f"❌ Invalid target: {error}"
         
         # Limit count for safety
-        count = min(max(count, 1), 10)
+        count = 1 if count < 1 else 10 if count > 10 else count
+        
+        # Concurrent requests for the same ping share a single subprocess
+        verbose = bool(verbose)
+        key = (target, count, verbose)
+        task = _inflight_pings.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_ping(target, count, verbose))
+            _inflight_pings[key] = task
+            task.add_done_callback(lambda _: _inflight_pings.pop(key, None))
+        
+        return await asyncio.shield(task)
+    
+    async def _run_ping(self, target: str, count: int, verbose: bool) -> str:
+        """
+        Run the ping subprocess and format its output.
+        
+        Args:
+            target: Validated target to ping
+            count: Number of ping packets (already clamped)
+            verbose: Include per-packet lines, not just the summary
+            
+        Returns:
+            str: Ping results
+        """
+        # Overall wall-clock budget: ~2s per packet plus process start-up
+        timeout = min(count * 2 + 5, self.get_config_value("timeout_seconds", 30))
         
         try:
-            import subprocess
+            # Run ping command; -q limits output to the summary unless
+            # verbose was requested
+            args = ['ping', '-c', str(count), target]
+            if not verbose:
+                args.insert(1, '-q')
+            if _PING_WAIT_SECONDS:
+                # iputils -W is seconds per reply; BSD/macOS read it as
+                # milliseconds, so elsewhere only the wait_for budget applies
+                args[-1:-1] = ['-W', '2']
             
-            # Run ping command
             result = await asyncio.create_subprocess_exec(
-                'ping', '-c', str(count), target,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                *args,
+                stdout=_PIPE,
+                stderr=_PIPE
             )
             
-            stdout, stderr = await result.communicate()
+            try:
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_bounded(result.stdout, MAX_OUTPUT_BYTES),
+                        _read_bounded(result.stderr, MAX_OUTPUT_BYTES),
+                        result.wait()
+                    ),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                result.kill()
+                await result.wait()
+                return f"❌ Ping timed out for {target} after {timeout}s"
             
             if result.returncode == 0:
-                output = stdout.decode('utf-8')
-                return f"🏠 Ping Results for {target}:\n\n{output}"
+                output = stdout.decode('utf-8', 'replace')
+                header = "Ping Results" if verbose else "Ping Summary"
+                return f"🏠 {header} for {target}:\n\n{output}"
             else:
-                error_msg = stderr.decode('utf-8')
+                error_msg = stderr.decode('utf-8', 'replace')
                 return f"❌ Ping failed for {target}:\n{error_msg}"
                 
         except Exception as e:
             return f"❌ Error executing ping: {str(e)}"
     
-    async def _info_tool(self) -> str:
+    async def _info_tool(self, **kwargs) -> str:
         """
         Get module information.
         
+        Any arguments are ignored.
+        
         Returns:
             str: Module information
         """
-        info = f"""📄 Example Module Information
-
-Module: {self.name}
-Status: {'Enabled' if self.enabled else 'Disabled'}
-Tools: {len(self._tools)}
-Config: {self.config.config}
+        return _INFO_TEMPLATE.format_map({
+            "name": self.name,
+            "status": "Enabled" if self.enabled else "Disabled",
+            "tools": len(self._tools),
+            "config": self.config.config
+        })
 
-This is an example module that demonstrates:
-- Tool registration and execution
-- Input validation
-- Async tool execution
-- Error handling
 
-Use this as a template for creating new security modules."""
-        
-        return info
\ No newline at end of file
+# Class picked up by ModuleLoader without relying on the <Name>Module convention
+MODULE_CLASS = ExampleModule
\ No newline at end of file
@@ -5,8 +5,14 @@ Logging configuration for the Security MCP Server.
 
 import logging
 import sys
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from typing import Optional
 
+# Log file rotation and write batching
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+LOG_BUFFER_CAPACITY = 512
+
 def setup_logging(level: int = logging.INFO, 
                   format_string: Optional[str] = None,
                   log_file: Optional[str] = None):
@@ -29,7 +35,14 @@ def setup_logging(level: int = logging.INFO,
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
-    # Clear existing handlers
+    # Close and clear existing handlers; closing flushes any buffered
+    # records and releases file handles from a previous call
+    for handler in list(root_logger.handlers):
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            # MemoryHandler.close() flushes but leaves its target open
+            target.close()
     root_logger.handlers.clear()
     
     # Console handler (stderr to avoid interfering with MCP stdio)
@@ -38,12 +51,31 @@ def setup_logging(level: int = logging.INFO,
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
     
-    # Optional file handler
+    # Optional file handler: rotated on size, written in batches that are
+    # flushed early on WARNING and above
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            delay=True
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        buffered_handler = MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler
+        )
+        buffered_handler.setLevel(level)
+        root_logger.addHandler(buffered_handler)
+    
+    # Skip collecting record fields the format string never uses
+    logging.logThreads = "%(thread" in format_string
+    logging.logProcesses = "%(process" in format_string
+    logging.logMultiprocessing = "%(processName" in format_string
+    logging.logAsyncioTasks = "%(taskName" in format_string
     
     # Set specific logger levels
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -4,9 +4,24 @@ Input validation utilities for security tools.
 """
 
 import re
+import string
+import functools
 import ipaddress
-from typing import Tuple
-from urllib.parse import urlparse
+from typing import Iterable, List, Tuple
+from urllib.parse import urlsplit
+
+_IPv4Address = ipaddress.IPv4Address
+_IPv6Address = ipaddress.IPv6Address
+
+# Character classes for the domain label scanner
+_ALNUM = frozenset(string.ascii_letters + string.digits)
+_LABEL_CHARS = _ALNUM | {'-'}
+
+# Pattern compiled once at import time
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Shell metacharacters stripped by sanitize_input (str.translate deletion table)
+_SANITIZE_TABLE = dict.fromkeys(map(ord, ';&|`$(){}[]<>'), None)
 
 def is_valid_ip(ip_string: str) -> bool:
     """
@@ -18,8 +33,13 @@ def is_valid_ip(ip_string: str) -> bool:
     Returns:
         bool: True if valid IP address
     """
+    # Only IPv6 addresses contain ':', so parse with the one matching class
+    # instead of letting ip_address() try (and fail) both.
     try:
-        ipaddress.ip_address(ip_string)
+        if ':' in ip_string:
+            _IPv6Address(ip_string)
+        else:
+            _IPv4Address(ip_string)
         return True
     except ValueError:
         return False
@@ -37,13 +57,23 @@ def is_valid_domain(domain: str) -> bool:
     if not domain or len(domain) > 253:
         return False
     
-    # Domain regex pattern
-    pattern = re.compile(
-        r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+'  
-        r'[a-zA-Z]{2,}$'
-    )
+    labels = domain.split('.')
+    tld = labels.pop()
+    
+    # Top-level label: at least two ASCII letters
+    if not labels or len(tld) < 2 or not (tld.isascii() and tld.isalpha()):
+        return False
     
-    return bool(pattern.match(domain))
+    # Other labels: 1-63 letters, digits or hyphens, not starting or ending with a hyphen
+    for label in labels:
+        if not 0 < len(label) <= 63:
+            return False
+        if label[0] not in _ALNUM or label[-1] not in _ALNUM:
+            return False
+        if not _LABEL_CHARS.issuperset(label):
+            return False
+    
+    return True
 
 def is_valid_url(url: str) -> bool:
     """
@@ -55,9 +85,10 @@ def is_valid_url(url: str) -> bool:
     Returns:
         bool: True if valid URL
     """
+    # urlsplit is memoized by the stdlib; scheme and netloc are all we need
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        result = urlsplit(url)
+        return bool(result.scheme and result.netloc)
     except Exception:
         return False
 
@@ -71,8 +102,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
         bool: True if valid email
     """
-    pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    return bool(pattern.match(email))
+    return bool(_EMAIL_RE.match(email))
 
 def validate_target(target: str) -> Tuple[bool, str, str]:
     """
@@ -87,22 +117,44 @@ def validate_target(target: str) -> Tuple[bool, str, str]:
     if not target or not isinstance(target, str):
         return False, "unknown", "Target must be a non-empty string"
     
+    return _validate_target_cached(target)
+
+@functools.lru_cache(maxsize=1024)
+def _validate_target_cached(target: str) -> Tuple[bool, str, str]:
+    """Classify a non-empty target string; results are memoized."""
     target = target.strip()
     
-    # Check if it's a URL
-    if is_valid_url(target):
-        return True, "url", ""
+    # Cheap checks first; a URL needs a scheme and netloc, so it can never
+    # be mistaken for a bare IP address or domain.
     
     # Check if it's an IP address
-    if is_valid_ip(target):
+    if target and (target[0].isdigit() or ':' in target) and is_valid_ip(target):
         return True, "ip", ""
     
     # Check if it's a domain
-    if is_valid_domain(target):
+    if "://" not in target and is_valid_domain(target):
         return True, "domain", ""
     
+    # Check if it's a URL
+    if is_valid_url(target):
+        return True, "url", ""
+    
     return False, "unknown", f"Invalid target format: {target}"
 
+def validate_targets(targets: Iterable[str]) -> List[Tuple[bool, str, str]]:
+    """
+    Validate and identify the type of many targets at once.
+    
+    Args:
+        targets: Targets to validate, e.g. the lines of a scope file
+        
+    Returns:
+        List[Tuple[bool, str, str]]: One (is_valid, target_type, error_message)
+        tuple per target, in input order
+    """
+    validate = validate_target
+    return [validate(target) for target in targets]
+
 def sanitize_input(input_str: str, max_length: int = 1000) -> str:
     """
     Sanitize input string for security.
@@ -118,7 +170,7 @@ def sanitize_input(input_str: str, max_length: int = 1000) -> str:
         return str(input_str)
     
     # Remove dangerous characters
-    sanitized = re.sub(r'[;&|`$(){}\[\]<>]', '', input_str)
+    sanitized = input_str.translate(_SANITIZE_TABLE)
     
     # Limit length
     if len(sanitized) > max_length: